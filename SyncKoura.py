@@ -1,19 +1,50 @@
+import bisect
 import json
+import math
 import re
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional, Dict, List
 from dateutil.relativedelta import relativedelta
+import orjson
 import yaml
 import os
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Create logger
 import logging
 logger = logging.getLogger(__name__)
 
+KOURA_HOST = "https://portal.kourawealth.co.nz"
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 30)
 
-def format_existing_act(act: dict, symbol_type: str = "symbol") -> dict:
+# Matches the transaction ID stored in activity comments, e.g. "transactionId=HOLDING-810002|..."
+_TXID_RE = re.compile(r"transactionId=([^|]+)")
+
+
+@dataclass(frozen=True, slots=True)
+class ActFingerprint:
+    """Fields used to compare activities, hashable for set lookups"""
+    account_id: str
+    date: str
+    fee: float
+    quantity: float
+    symbol: str
+    type: str
+    unit_price: float
+
+
+def format_existing_act(act: dict, symbol_type: str = "symbol") -> ActFingerprint:
     symbol = act.get("SymbolProfile", {symbol_type: ""}).get(symbol_type)
 
     if symbol is None or len(symbol) == 0:
@@ -21,65 +52,89 @@ def format_existing_act(act: dict, symbol_type: str = "symbol") -> dict:
                        symbol_type, act["id"], act.get("SymbolProfile"))
         symbol = act.get("symbol", "")
 
-    return {
-        "accountId": act["accountId"],
-        "date": act["date"][0:18],
-        "fee": abs(float(act["fee"])),
-        "quantity": abs(float(act["quantity"])),
-        "symbol": symbol,
-        "type": act["type"],
-        "unitPrice": act["unitPrice"]
-    }
+    return ActFingerprint(
+        account_id=act["accountId"],
+        date=act["date"][0:18],
+        fee=abs(float(act["fee"])),
+        quantity=abs(float(act["quantity"])),
+        symbol=symbol,
+        type=act["type"],
+        unit_price=act["unitPrice"]
+    )
+
+
+def format_new_act(act: dict, symbol_type: str = "symbol") -> ActFingerprint:
+    return ActFingerprint(
+        account_id=act["accountId"],
+        date=act["date"][0:18],
+        fee=abs(float(act["fee"])),
+        quantity=abs(float(act["quantity"])),
+        symbol=act.get(symbol_type, ""),
+        type=act["type"],
+        unit_price=act["unitPrice"]
+    )
+
+
+def get_transaction_id(act: dict) -> Optional[str]:
+    comment = act.get("comment")
+    if comment is None:
+        return None
+    # Extract the transactionId from the comment using regular expressions
+    match = _TXID_RE.search(comment)
+    return match.group(1) if match else None
 
 
-def format_new_act(act: dict, symbol_type: str = "symbol") -> dict:
-    return {
-        "accountId": act["accountId"],
-        "date": act["date"][0:18],
-        "fee": abs(float(act["fee"])),
-        "quantity": abs(float(act["quantity"])),
-        "symbol": act.get(symbol_type, ""),
-        "type": act["type"],
-        "unitPrice": act["unitPrice"]
-    }
-
+def get_diff(old_acts, new_acts):
+    synced_acts_ids = set()
+    for old_act in old_acts:
+        transaction_id = get_transaction_id(old_act)
+        if transaction_id is not None:
+            synced_acts_ids.add(transaction_id)
 
-def is_act_present(new_act, existing_acts, synced_acts_ids: set):
-    # Precise comparison using the transaction ID
-    comment = new_act.get("comment")
-    if comment is not None:
-        # Extract the transactionId from the comment using regular expressions
-        match = re.search(r"transactionId=([^|]+)", comment)
-        if match:
-            transaction_id = match.group(1)
-            if transaction_id in synced_acts_ids:
-                return True
+    # Precise comparison using the transaction ID. This settles most activities, so the
+    # existing activities are only walked a second time, to fingerprint them for the
+    # legacy comparison, when some new activity is left unmatched
+    unmatched = [new_act for new_act in new_acts if get_transaction_id(new_act) not in synced_acts_ids]
+    if not unmatched:
+        return []
 
     # Legacy comparison
-    for existing_act in existing_acts:
-        formatted_act = format_existing_act(existing_act)
-        formatted_new_act = format_new_act(new_act)
-        if formatted_act == formatted_new_act:
-            return True
-    return False
+    existing_fingerprints = {format_existing_act(old_act) for old_act in old_acts}
+    return [new_act for new_act in unmatched if format_new_act(new_act) not in existing_fingerprints]
 
 
-def get_diff(old_acts, new_acts):
-    diff = []
-    synced_acts_ids = set()
-    for old_act in old_acts:
-        comment = old_act.get("comment")
-        if comment is not None:
-            # Extract the transactionId from the comment
-            match = re.search(r"transactionId=([^|]+)", comment)
-            if match:
-                transaction_id = match.group(1)
-                synced_acts_ids.add(transaction_id)
+# Parsed mapping files keyed by (path, mtime), so edits to the file are picked up
+_mapping_cache: Dict[tuple, dict] = {}
+
+
+def load_mapping_file(mapping_file: str) -> dict:
+    key = (mapping_file, os.path.getmtime(mapping_file))
+    if key not in _mapping_cache:
+        with open(mapping_file, 'r') as file:
+            _mapping_cache[key] = yaml.load(file, Loader=SafeLoader)
+    return _mapping_cache[key]
+
+
+# Keep-alive connection pool with retries on transient server errors. Shared by the
+# sessions of every SyncKoura instance so connections are reused across accounts.
+_http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                            max_retries=Retry(total=3, backoff_factor=0.3,
+                                              status_forcelist=[429, 500, 502, 503, 504],
+                                              raise_on_status=False))
+
+
+def create_session() -> requests.Session:
+    # Sessions only carry per-instance headers, connections come from the shared adapter
+    session = requests.Session()
+    session.mount("https://", _http_adapter)
+    session.mount("http://", _http_adapter)
+    session.headers.update({'Content-Type': 'application/json'})
+    return session
 
-    for new_act in new_acts:
-        if not is_act_present(new_act, old_acts, synced_acts_ids):
-            diff.append(new_act)
-    return diff
+
+def worker_pool(max_workers: int) -> ThreadPoolExecutor:
+    # Workers inherit the calling thread's name so their log lines stay tagged with the account
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=threading.current_thread().name)
 
 
 def generate_chunks(lst, n):
@@ -87,6 +142,21 @@ def generate_chunks(lst, n):
         yield lst[i:i + n]
 
 
+# Default fund mapping - use Ghostfolio GF_ prefix for manual assets
+DEFAULT_FUND_MAPPING = MappingProxyType({
+    "810001": "GF_KOURACASH",  # Cash Fund
+    "810002": "GF_KOURAFI",  # Fixed Interest Fund
+    "810003": "GF_KOURANZEQ",  # NZ Equities Fund
+    "810004": "GF_KOURAUSEQ",  # US Equities Fund
+    "810005": "GF_KOURAROWEQ",  # Rest of World Equities Fund
+    "810006": "GF_KOURAEMEQ",  # Emerging Markets Equities Fund
+    "810007": "GF_KOURABTC",  # Bitcoin Fund
+    "810008": "GF_KOURACLEAN",  # Clean Energy Fund
+    "810009": "GF_KOURAPROP",  # Property Fund
+    "810010": "GF_KOURASTRAT",  # Strategic Growth Fund
+})
+
+
 class SyncKoura:
     # Allocation field mapping (from API to fund code)
     ALLOCATION_MAPPING = {
@@ -105,6 +175,14 @@ class SyncKoura:
     def __init__(self, ghost_host, koura_username, koura_password, ghost_key, ghost_token,
                  koura_account_id, ghost_account_name, ghost_currency, ghost_koura_platform, mapping_file='mapping.yaml'):
         self.account_id: Optional[str] = None
+        self.accounts: Optional[List[dict]] = None  # Cached Ghostfolio accounts, reset on account creation
+        self.koura_user_tag = "a8a4a355-8722-4a24-b24c-115b0470cdef"  # Required header
+        self.koura_session = create_session()
+        self.koura_session.headers.update({
+            'Origin': 'https://my.kourawealth.co.nz',
+            'X-User-Tag': self.koura_user_tag
+        })
+        self.ghost_session = create_session()
         if ghost_token == "" and ghost_key != "":
             self.ghost_token = self.create_ghost_token(ghost_host, ghost_key)
         else:
@@ -113,6 +191,7 @@ class SyncKoura:
         if self.ghost_token is None or self.ghost_token == "":
             logger.info("No bearer token provided, closing now")
             raise Exception("No bearer token provided")
+        self.ghost_session.headers.update({'Authorization': f"Bearer {self.ghost_token}"})
 
         self.ghost_host = ghost_host
         self.koura_account_id = koura_account_id
@@ -122,31 +201,18 @@ class SyncKoura:
         self.koura_password = koura_password
         self.koura_platform = ghost_koura_platform
         self.koura_token = None
-        self.koura_user_tag = "a8a4a355-8722-4a24-b24c-115b0470cdef"  # Required header
 
-        # Initialize fund mapping - use Ghostfolio GF_ prefix for manual assets
-        self.fund_mapping = {
-            "810001": "GF_KOURACASH",  # Cash Fund
-            "810002": "GF_KOURAFI",  # Fixed Interest Fund
-            "810003": "GF_KOURANZEQ",  # NZ Equities Fund
-            "810004": "GF_KOURAUSEQ",  # US Equities Fund
-            "810005": "GF_KOURAROWEQ",  # Rest of World Equities Fund
-            "810006": "GF_KOURAEMEQ",  # Emerging Markets Equities Fund
-            "810007": "GF_KOURABTC",  # Bitcoin Fund
-            "810008": "GF_KOURACLEAN",  # Clean Energy Fund
-            "810009": "GF_KOURAPROP",  # Property Fund
-            "810010": "GF_KOURASTRAT",  # Strategic Growth Fund
-        }
+        # Initialize fund mapping from the defaults, custom mappings may override entries
+        self.fund_mapping = dict(DEFAULT_FUND_MAPPING)
 
         # Load custom fund mapping from yaml file
         if os.path.exists(mapping_file):
             try:
-                with open(mapping_file, 'r') as file:
-                    config = yaml.safe_load(file)
-                    custom_mapping = config.get('symbol_mapping', {})
-                    if custom_mapping:
-                        self.fund_mapping.update(custom_mapping)
-                        logger.info("Loaded custom symbol mappings from %s", mapping_file)
+                config = load_mapping_file(mapping_file)
+                custom_mapping = config.get('symbol_mapping', {})
+                if custom_mapping:
+                    self.fund_mapping.update(custom_mapping)
+                    logger.info("Loaded custom symbol mappings from %s", mapping_file)
             except Exception as e:
                 logger.warning("Failed to load mapping file %s: %s", mapping_file, e)
 
@@ -154,22 +220,17 @@ class SyncKoura:
         """Authenticate with Koura Wealth and get JWT token"""
         logger.info("Authenticating with Koura Wealth")
 
-        url = "https://portal.kourawealth.co.nz/api/clients/auth/signin"
-        payload = json.dumps({
+        url = f"{KOURA_HOST}/api/clients/auth/signin"
+        payload = orjson.dumps({
             "Username": self.koura_username,
             "Password": self.koura_password
         })
-        headers = {
-            'Content-Type': 'application/json',
-            'Origin': 'https://my.kourawealth.co.nz',
-            'X-User-Tag': self.koura_user_tag
-        }
-
         try:
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self.koura_session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.koura_token = data['token']
+                self.koura_session.headers.update({'Authorization': f'Bearer {self.koura_token}'})
                 logger.info("Successfully authenticated with Koura Wealth")
                 return True
             else:
@@ -184,17 +245,11 @@ class SyncKoura:
         if not self.koura_token:
             self.authenticate_koura()
 
-        url = "https://portal.kourawealth.co.nz/api/clients/accounts"
-        headers = {
-            'Authorization': f'Bearer {self.koura_token}',
-            'Origin': 'https://my.kourawealth.co.nz',
-            'X-User-Tag': self.koura_user_tag
-        }
-
+        url = f"{KOURA_HOST}/api/clients/accounts"
         try:
-            response = requests.request("GET", url, headers=headers)
+            response = self.koura_session.get(url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error("Failed to get accounts: %s", response.text)
                 return []
@@ -207,17 +262,11 @@ class SyncKoura:
         if not self.koura_token:
             self.authenticate_koura()
 
-        url = f"https://portal.kourawealth.co.nz/api/clients/account/{account_id}"
-        headers = {
-            'Authorization': f'Bearer {self.koura_token}',
-            'Origin': 'https://my.kourawealth.co.nz',
-            'X-User-Tag': self.koura_user_tag
-        }
-
+        url = f"{KOURA_HOST}/api/clients/account/{account_id}"
         try:
-            response = requests.request("GET", url, headers=headers)
+            response = self.koura_session.get(url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error("Failed to get account details: %s", response.text)
                 return None
@@ -230,17 +279,11 @@ class SyncKoura:
         if not self.koura_token:
             self.authenticate_koura()
 
-        url = f"https://portal.kourawealth.co.nz/api/clients/account/{account_id}/portfolio/funds"
-        headers = {
-            'Authorization': f'Bearer {self.koura_token}',
-            'Origin': 'https://my.kourawealth.co.nz',
-            'X-User-Tag': self.koura_user_tag
-        }
-
+        url = f"{KOURA_HOST}/api/clients/account/{account_id}/portfolio/funds"
         try:
-            response = requests.request("GET", url, headers=headers)
+            response = self.koura_session.get(url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error("Failed to get portfolio funds: %s", response.text)
                 return []
@@ -253,17 +296,12 @@ class SyncKoura:
         if not self.koura_token:
             self.authenticate_koura()
 
-        url = f"https://portal.kourawealth.co.nz/api/clients/account/{account_id}/transactions"
-        headers = {
-            'Authorization': f'Bearer {self.koura_token}',
-            'Origin': 'https://my.kourawealth.co.nz',
-            'X-User-Tag': self.koura_user_tag
-        }
-
+        url = f"{KOURA_HOST}/api/clients/account/{account_id}/transactions"
         try:
-            response = requests.request("GET", url, headers=headers, params={"page": page, "pageSize": page_size})
+            response = self.koura_session.get(url, params={"page": page, "pageSize": page_size},
+                                             timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error("Failed to get transactions: %s", response.text)
                 return {"transactions": [], "totalCount": 0}
@@ -273,42 +311,49 @@ class SyncKoura:
 
     def get_all_koura_transactions(self, account_id: int) -> List[dict]:
         """Get all transactions by paginating through results"""
-        all_transactions = []
-        page = 1
         page_size = 100
 
-        while True:
-            result = self.get_koura_transactions(account_id, page, page_size)
-            transactions = result.get("transactions", [])
-            all_transactions.extend(transactions)
-
-            if len(all_transactions) >= result.get("totalCount", 0):
-                break
-            page += 1
-
+        # First page tells us how many pages there are. Size pages by the rows actually
+        # returned, in case Koura caps pageSize below what was asked for
+        result = self.get_koura_transactions(account_id, 1, page_size)
+        all_transactions = list(result.get("transactions", []))
+        total_count = result.get("totalCount", 0)
+        per_page = len(all_transactions) or page_size
+        num_pages = math.ceil(total_count / per_page)
+
+        if num_pages > 1:
+            # Remaining pages are independent, fetch them concurrently (map keeps page order)
+            with worker_pool(8) as executor:
+                results = executor.map(lambda page: self.get_koura_transactions(account_id, page, page_size),
+                                       range(2, num_pages + 1))
+                for result in results:
+                    all_transactions.extend(result.get("transactions", []))
+
+        if len(all_transactions) < total_count:
+            logger.warning("Retrieved only %d of %d Koura transactions", len(all_transactions), total_count)
         return all_transactions
 
     def get_unit_price_for_date(self, fund_data: dict, transaction_date: str) -> Optional[float]:
         """Get the unit price for a fund on a specific date"""
         valuation = fund_data.get("valuation", {})
+        # Accept full ISO timestamps too, valuation keys are date-only
+        transaction_date = transaction_date[:10]
 
         # Try exact match first
         if transaction_date in valuation:
             return valuation[transaction_date]
 
-        # Find closest previous date
-        transaction_dt = datetime.strptime(transaction_date, "%Y-%m-%d")
-        closest_date = None
-        closest_price = None
+        # Find closest previous date. Dates are zero-padded ISO strings (YYYY-MM-DD),
+        # so lexicographic order is chronological order and a binary search suffices.
+        sorted_dates = fund_data.get("_sorted_dates")
+        if sorted_dates is None or len(sorted_dates) != len(valuation):
+            sorted_dates = sorted(valuation.keys())
+            fund_data["_sorted_dates"] = sorted_dates
 
-        for date_str, price in valuation.items():
-            date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-            if date_dt <= transaction_dt:
-                if closest_date is None or date_dt > closest_date:
-                    closest_date = date_dt
-                    closest_price = price
-
-        return closest_price
+        idx = bisect.bisect_right(sorted_dates, transaction_date) - 1
+        if idx < 0:
+            return None
+        return valuation[sorted_dates[idx]]
 
     def reconstruct_fund_purchases(self, transactions: List[dict], account_details: dict,
                                    portfolio_funds: List[dict]) -> List[dict]:
@@ -362,31 +407,51 @@ class SyncKoura:
         """Main sync method"""
         logger.info("Starting Koura Wealth sync")
 
+        # Parse the Koura account ID once, before any network round-trip
+        try:
+            koura_account_id = int(self.koura_account_id)
+        except (TypeError, ValueError):
+            logger.error("Invalid Koura account ID: %s", self.koura_account_id)
+            return
+
+        # Koura login and the read-only Ghostfolio account listing hit different hosts, run them concurrently
+        with worker_pool(2) as executor:
+            authenticated_future = executor.submit(self.authenticate_koura)
+            accounts_future = executor.submit(self.get_all_accounts)
+
         # Authenticate with Koura
-        if not self.authenticate_koura():
+        if not authenticated_future.result():
             logger.error("Failed to authenticate with Koura")
             return
 
-        # Get or create Ghostfolio account
+        # Get or create Ghostfolio account, only once Koura login succeeded (reuses the cached listing)
+        accounts_future.result()
         account_id = self.create_or_get_koura_accountId()
         if account_id == "":
             logger.info("Failed to retrieve account ID closing now")
             return
 
+        # The Koura lookups and the Ghostfolio activity fetch are independent, run them concurrently
+        with worker_pool(4) as executor:
+            account_details_future = executor.submit(self.get_koura_account_details, koura_account_id)
+            portfolio_funds_future = executor.submit(self.get_koura_portfolio_funds, koura_account_id)
+            transactions_future = executor.submit(self.get_all_koura_transactions, koura_account_id)
+            existing_acts_future = executor.submit(self.get_all_acts_for_account, account_id)
+
         # Get Koura account details
-        account_details = self.get_koura_account_details(int(self.koura_account_id))
+        account_details = account_details_future.result()
         if not account_details:
             logger.error("Failed to get account details")
             return
 
         # Get portfolio funds (for historical prices)
-        portfolio_funds = self.get_koura_portfolio_funds(int(self.koura_account_id))
+        portfolio_funds = portfolio_funds_future.result()
         if not portfolio_funds:
             logger.error("Failed to get portfolio funds")
             return
 
         # Get all transactions
-        transactions = self.get_all_koura_transactions(int(self.koura_account_id))
+        transactions = transactions_future.result()
         logger.info("Retrieved %d transactions from Koura", len(transactions))
 
         # Reconstruct fund purchases
@@ -398,7 +463,7 @@ class SyncKoura:
             activity["accountId"] = account_id
 
         # Get existing activities from Ghostfolio
-        existing_acts = self.get_all_acts_for_account()
+        existing_acts = existing_acts_future.result()
 
         # Find new activities
         diff = get_diff(existing_acts, activities)
@@ -423,18 +488,15 @@ class SyncKoura:
 
         url = f"{ghost_host}/api/v1/auth/anonymous"
 
-        payload = json.dumps(token)
-        headers = {
-            'Content-Type': 'application/json'
-        }
+        payload = orjson.dumps(token)
         try:
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self.ghost_session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
         except Exception as e:
             logger.info(e)
             return ""
         if response.status_code == 201:
             logger.info("Bearer token fetched")
-            return response.json()["authToken"]
+            return orjson.loads(response.content)["authToken"]
         logger.info("Failed fetching bearer token")
         return ""
 
@@ -451,49 +513,62 @@ class SyncKoura:
                 "name": self.ghost_account_name,
                 "platformId": self.koura_platform
             }
+            if self.is_account_up_to_date(amount_data):
+                logger.info("Cash for account " + account_id + " already up to date, skipping update")
+                continue
             logger.info("Updating Cash for account " + account_id + ": " + json.dumps(amount_data))
 
             url = f"{self.ghost_host}/api/v1/account/{account_id}"
 
-            payload = json.dumps(amount_data)
-            headers = {
-                'Authorization': f"Bearer {self.ghost_token}",
-                'Content-Type': 'application/json'
-            }
+            payload = orjson.dumps(amount_data)
             try:
-                response = requests.request("PUT", url, headers=headers, data=payload)
+                response = self.ghost_session.put(url, data=payload, timeout=REQUEST_TIMEOUT)
             except Exception as e:
                 logger.info(e)
                 return
             if response.status_code == 200:
-                logger.info(f"Updated Cash for account {response.json()['id']}")
+                logger.info(f"Updated Cash for account {orjson.loads(response.content)['id']}")
+                self.accounts = None
             else:
                 logger.info("Failed create: " + response.text)
 
+    def is_account_up_to_date(self, account_data: dict) -> bool:
+        # Compare against the account list already fetched this run, no extra request
+        for account in self.accounts or []:
+            if account["id"] == account_data["id"]:
+                # An empty GHOST_KOURA_PLATFORM is sent as "" but Ghostfolio returns null
+                return all((account.get(key) or None) == (value or None) if key == "platformId"
+                           else account.get(key) == value
+                           for key, value in account_data.items())
+        return False
+
     def import_act(self, bulk):
-        chunks = generate_chunks(sorted(bulk, key=lambda x: x["date"]), 10)
-        for acts in chunks:
-            logger.info("Adding activities:\n%s", json.dumps(acts, indent=4))
-
-            url = f"{self.ghost_host}/api/v1/import"
-            payload = json.dumps({"activities": acts})
-            headers = {
-                'Authorization': f"Bearer {self.ghost_token}",
-                'Content-Type': 'application/json'
-            }
+        chunks = list(generate_chunks(bulk, 10))
+        # Chunks are posted concurrently, so Ghostfolio receives them in completion order rather
+        # than by date. Every activity carries its own date, the import does not rely on ordering.
+        with worker_pool(4) as executor:
+            results = list(executor.map(self._post_import_chunk, chunks))
+        if any(results):
+            # Imported activities change the account, the cached listing is stale
+            self.accounts = None
+        return all(results)
+
+    def _post_import_chunk(self, acts):
+        logger.info("Adding activities:\n%s", json.dumps(acts, indent=4))
+
+        url = f"{self.ghost_host}/api/v1/import"
+        payload = orjson.dumps({"activities": acts})
 
-            try:
-                response = requests.request("POST", url, headers=headers, data=payload)
-            except Exception as e:
-                logger.info(e)
-                return False
-            if response.status_code == 201:
-                logger.info("Added activities. Response:\n%s", json.dumps(response.json(), indent=4))
-            else:
-                logger.info("Failed to create: " + response.text)
-            if response.status_code != 201:
-                return False
-        return True
+        try:
+            response = self.ghost_session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
+        except Exception as e:
+            logger.info(e)
+            return False
+        if response.status_code == 201:
+            logger.info("Added activities. Response:\n%s", json.dumps(orjson.loads(response.content), indent=4))
+        else:
+            logger.info("Failed to create: " + response.text)
+        return response.status_code == 201
 
     def create_koura_account(self):
         logger.info("Creating Koura account in Ghostfolio")
@@ -507,37 +582,35 @@ class SyncKoura:
 
         url = f"{self.ghost_host}/api/v1/account"
 
-        payload = json.dumps(account)
-        headers = {
-            'Authorization': f"Bearer {self.ghost_token}",
-            'Content-Type': 'application/json'
-        }
+        payload = orjson.dumps(account)
         try:
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self.ghost_session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
         except Exception as e:
             logger.info(e)
             return ""
         if response.status_code == 201:
-            logger.info("Koura account: " + response.json()["id"])
-            return response.json()["id"]
+            account_id = orjson.loads(response.content)["id"]
+            logger.info("Koura account: " + account_id)
+            self.accounts = None
+            return account_id
         logger.info("Failed creating ")
         return ""
 
     def get_all_accounts(self):
+        if self.accounts is not None:
+            return self.accounts
+
         logger.info("Finding all accounts")
         url = f"{self.ghost_host}/api/v1/account"
 
-        payload = {}
-        headers = {
-            'Authorization': f"Bearer {self.ghost_token}",
-        }
         try:
-            response = requests.request("GET", url, headers=headers, data=payload)
+            response = self.ghost_session.get(url, timeout=REQUEST_TIMEOUT)
         except Exception as e:
             logger.info(e)
             return []
         if response.status_code == 200:
-            return response.json()['accounts']
+            self.accounts = orjson.loads(response.content)['accounts']
+            return self.accounts
         else:
             raise Exception(response)
 
@@ -557,7 +630,8 @@ class SyncKoura:
         return self.account_id
 
     def delete_all_acts(self):
-        acts = self.get_all_acts_for_account()
+        account_id = self.create_or_get_koura_accountId()
+        acts = self.get_all_acts_for_account(account_id)
 
         if not acts:
             logger.info("No activities to delete")
@@ -565,16 +639,10 @@ class SyncKoura:
 
         url = f"{self.ghost_host}/api/v1/order"
 
-        payload = {}
-        headers = {
-            'Authorization': f"Bearer {self.ghost_token}",
-        }
         try:
-            response = requests.request("DELETE",
-                                        url,
-                                        headers=headers,
-                                        params={"accounts": self.create_or_get_koura_accountId()},
-                                        data=payload)
+            response = self.ghost_session.delete(url,
+                                                 params={"accounts": account_id},
+                                                 timeout=REQUEST_TIMEOUT)
         except Exception as e:
             logger.info(e)
             return False
@@ -587,23 +655,17 @@ class SyncKoura:
 
         url = f"{self.ghost_host}/api/v1/order"
 
-        payload = {}
-        headers = {
-            'Authorization': f"Bearer {self.ghost_token}",
-        }
         try:
-            response = requests.request("GET",
-                                        url,
-                                        headers=headers,
-                                        params={"accounts": account_id,
-                                                "range": range,
-                                                "symbol": symbol},
-                                        data=payload)
+            response = self.ghost_session.get(url,
+                                              params={"accounts": account_id,
+                                                      "range": range,
+                                                      "symbol": symbol},
+                                              timeout=REQUEST_TIMEOUT)
         except Exception as e:
             logger.info(e)
             return []
 
         if response.status_code == 200:
-            return response.json()['activities']
+            return orjson.loads(response.content)['activities']
         else:
             return []
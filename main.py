@@ -1,5 +1,12 @@
 import logging
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from typing import Dict, List, Sequence, Tuple
 
 from dotenv import load_dotenv
 from SyncKoura import SyncKoura
@@ -8,7 +15,7 @@ from SyncKoura import SyncKoura
 load_dotenv()
 from pretty_print import pretty_print_table
 
-template = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+template = "%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s"
 logging.basicConfig(level=logging.INFO, format=template)
 logger = logging.getLogger(__name__)
 
@@ -16,54 +23,135 @@ SYNCKOURA = "SYNCKOURA"
 DELETE_ALL_ACTS = "DELETE_ALL_ACTS"
 GET_ALL_ACTS = "GET_ALL_ACTS"
 
-ghost_keys = os.environ.get("GHOST_KEY", "").split(",")
-ghost_tokens = os.environ.get("GHOST_TOKEN", "").split(",")
-koura_usernames = os.environ.get("KOURA_USERNAME", "").split(",")
-koura_passwords = os.environ.get("KOURA_PASSWORD", "").split(",")
-ghost_hosts = os.environ.get("GHOST_HOST", "https://ghostfol.io").split(",")
-koura_account_ids = os.environ.get("KOURA_ACCOUNT_ID", "").split(",")
-ghost_account_names = os.environ.get("GHOST_ACCOUNT_NAME", "Koura Wealth").split(",")
-ghost_currencies = os.environ.get("GHOST_CURRENCY", "NZD").split(",")
-operations = os.environ.get("OPERATION", SYNCKOURA).split(",")
-ghost_koura_platforms = os.environ.get("GHOST_KOURA_PLATFORM", "").split(",")
+
+@lru_cache(maxsize=None)
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    # Comma-separated env values, one per operation
+    return tuple(os.environ.get(name, default).split(","))
+
+
+@dataclass(frozen=True, slots=True)
+class AccountCfg:
+    """Settings for one operation, resolved from the comma-separated env lists"""
+    ghost_host: str
+    koura_username: str
+    koura_password: str
+    ghost_key: str
+    ghost_token: str
+    koura_account_id: str
+    ghost_account_name: str
+    ghost_currency: str
+    ghost_koura_platform: str
+    operation: str
+
+
+def pad(values: Sequence[str], n: int) -> List[str]:
+    # Lists shorter than OPERATION reuse their last value
+    return list(islice(chain(values, repeat(values[-1])), n))
+
+
+def load_configs() -> List[AccountCfg]:
+    operations = _env_list("OPERATION", SYNCKOURA)
+    n_operations = len(operations)
+    return [
+        AccountCfg(*row)
+        for row in zip(pad(_env_list("GHOST_HOST", "https://ghostfol.io"), n_operations),
+                       pad(_env_list("KOURA_USERNAME", ""), n_operations),
+                       pad(_env_list("KOURA_PASSWORD", ""), n_operations),
+                       pad(_env_list("GHOST_KEY", ""), n_operations),
+                       pad(_env_list("GHOST_TOKEN", ""), n_operations),
+                       pad(_env_list("KOURA_ACCOUNT_ID", ""), n_operations),
+                       pad(_env_list("GHOST_ACCOUNT_NAME", "Koura Wealth"), n_operations),
+                       pad(_env_list("GHOST_CURRENCY", "NZD"), n_operations),
+                       pad(_env_list("GHOST_KOURA_PLATFORM", ""), n_operations),
+                       operations)
+    ]
+
+
+class LazyStr:
+    """Defers building a log argument until the logging handler formats it"""
+
+    def __init__(self, fn, *args):
+        self.fn = fn
+        self.args = args
+
+    def __str__(self):
+        return self.fn(*self.args)
+
+
+def _do_sync(ghost: SyncKoura, i: int):
+    logger.info("Starting sync for account %s: %s", i, ghost.koura_account_id)
+    ghost.sync_koura()
+    logger.info("End sync")
+
+
+def _do_get(ghost: SyncKoura, i: int):
+    logger.info("Getting all activities")
+    logger.info("Start of operation")
+    activities = ghost.get_all_acts_for_account()
+    table_data = [[activity['id'], activity['SymbolProfile']['name'], activity['type'],
+                   activity['date'], activity['quantity'], activity['fee'], activity['value'],
+                   activity['SymbolProfile']['currency'], activity['comment']]
+                  for activity in activities]
+    # Only rendered if the record is actually emitted
+    table = LazyStr(pretty_print_table, ["ID", "NAME", "TYPE", "DATE", "QUANTITY",
+                                         "FEE", "VALUE", "CURRENCY", "COMMENT"],
+                    table_data)
+    logger.info("\n%s", table)
+    logger.info("End of operation")
+
+
+def _do_delete(ghost: SyncKoura, i: int):
+    logger.info("Starting delete")
+    ghost.delete_all_acts()
+    logger.info("End delete")
+
+
+def _unknown(ghost: SyncKoura, i: int):
+    logger.info("Unknown Operation")
+
+
+DISPATCH = {
+    SYNCKOURA: _do_sync,
+    GET_ALL_ACTS: _do_get,
+    DELETE_ALL_ACTS: _do_delete,
+}
+
+
+def run_operation(i: int, cfg: AccountCfg):
+    sync_args = asdict(cfg)
+    operation = sync_args.pop("operation")
+    ghost = SyncKoura(**sync_args)
+    DISPATCH.get(operation, _unknown)(ghost, i)
+
+
+def run_operations(entries: List[Tuple[int, AccountCfg]]):
+    # Tag this thread so log lines from concurrently running accounts can be told apart
+    _, cfg = entries[0]
+    threading.current_thread().name = f"{cfg.ghost_account_name}@{cfg.ghost_host}"
+    for i, cfg in entries:
+        run_operation(i, cfg)
 
 
 if __name__ == '__main__':
-    for i in range(len(operations)):
-        ghost_host = ghost_hosts[i] if len(ghost_hosts) > i else ghost_hosts[-1]
-        koura_username = koura_usernames[i] if len(koura_usernames) > i else koura_usernames[-1]
-        koura_password = koura_passwords[i] if len(koura_passwords) > i else koura_passwords[-1]
-        ghost_key = ghost_keys[i] if len(ghost_keys) > i else ghost_keys[-1]
-        ghost_token = ghost_tokens[i] if len(ghost_tokens) > i else ghost_tokens[-1]
-        koura_account_id = koura_account_ids[i] if len(koura_account_ids) > i else koura_account_ids[-1]
-        ghost_account_name = ghost_account_names[i] if len(ghost_account_names) > i else ghost_account_names[-1]
-        ghost_currency = ghost_currencies[i] if len(ghost_currencies) > i else ghost_currencies[-1]
-        ghost_koura_platform = ghost_koura_platforms[i] if len(ghost_koura_platforms) > i else ghost_koura_platforms[-1]
-
-        ghost = SyncKoura(ghost_host, koura_username, koura_password, ghost_key, ghost_token, koura_account_id,
-                         ghost_account_name, ghost_currency, ghost_koura_platform)
-
-        if operations[i] == SYNCKOURA:
-            logger.info("Starting sync for account %s: %s", i, koura_account_ids[i] if len(koura_account_ids) > i else "Unknown")
-            ghost.sync_koura()
-            logger.info("End sync")
-        elif operations[i] == GET_ALL_ACTS:
-            logger.info("Getting all activities")
-            logger.info("Start of operation")
-            table_data = []
-            activities = ghost.get_all_acts_for_account()
-            for activity in activities:
-                table_data.append([activity['id'], activity['SymbolProfile']['name'], activity['type'],
-                                   activity['date'], activity['quantity'], activity['fee'], activity['value'],
-                                   activity['SymbolProfile']['currency'], activity['comment']])
-            table = pretty_print_table(["ID", "NAME", "TYPE", "DATE", "QUANTITY",
-                                        "FEE", "VALUE", "CURRENCY", "COMMENT"],
-                                       table_data)
-            logger.info("\n%s", table)
-            logger.info("End of operation")
-        elif operations[i] == DELETE_ALL_ACTS:
-            logger.info("Starting delete")
-            ghost.delete_all_acts()
-            logger.info("End delete")
-        else:
-            logger.info("Unknown Operation")
+    # Operations on the same Ghostfolio account keep their order (e.g. DELETE_ALL_ACTS then SYNCKOURA),
+    # different accounts are independent and run concurrently. The account is identified by host,
+    # Ghostfolio user (token, or key when no token is given) and account name.
+    groups: Dict[Tuple[str, str, str], List[Tuple[int, AccountCfg]]] = {}
+    for i, cfg in enumerate(load_configs()):
+        ghost_identity = cfg.ghost_token or cfg.ghost_key
+        groups.setdefault((cfg.ghost_host, ghost_identity, cfg.ghost_account_name), []).append((i, cfg))
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(len(groups), 8)) as executor:
+        futures = {executor.submit(run_operations, entries): key for key, entries in groups.items()}
+        for future in as_completed(futures):
+            ghost_host, _, ghost_account_name = futures[future]
+            try:
+                future.result()
+            except Exception:
+                logger.exception("Operations failed for account %s on %s", ghost_account_name, ghost_host)
+                failed = True
+
+    if failed:
+        sys.exit(1)